@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import NewsArticle, GeneratedPost
+from .models import NewsArticle, GeneratedPost, FetchedDocument
 
 @admin.register(NewsArticle)
 class NewsArticleAdmin(admin.ModelAdmin):
@@ -27,4 +27,9 @@ class GeneratedPostAdmin(admin.ModelAdmin):
     # دالة مخصصة لجلب رقم المقال
     @admin.display(description='Article ID')
     def get_article_id(self, obj):
-        return obj.article.id
\ No newline at end of file
+        return obj.article.id
+
+@admin.register(FetchedDocument)
+class FetchedDocumentAdmin(admin.ModelAdmin):
+    list_display = ('id', 'url', 'title', 'fetched_at')
+    search_fields = ('url', 'title')
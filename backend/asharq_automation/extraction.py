@@ -0,0 +1,241 @@
+import re
+from html.parser import HTMLParser
+
+# وسوم لا تحتوي نص الخبر إطلاقًا
+SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'svg', 'iframe', 'form', 'button', 'select', 'nav', 'aside'}
+# وسوم غالبًا خارج متن الخبر، لكنها تُعامل كتلميح سلبي فقط لأنها قد تحمل عنوان الخبر داخل <article>
+NEGATIVE_TAGS = {'header', 'footer'}
+# لا تُعتبر هذه الوسوم سلبية أبدًا مهما كانت أصنافها (مثل <body class="has-sidebar">)
+PROTECTED_TAGS = {'html', 'body', 'main', 'article'}
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+BLOCK_TAGS = {'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'blockquote', 'pre'}
+CONTAINER_TAGS = {'div', 'section', 'article', 'main', 'body', 'td', 'ul', 'ol'}
+# وسم الفقرة الضمنية: نص مكتوب مباشرة داخل حاوية (<div>نص<br><br>نص</div>) بدون وسم <p>
+TEXT_BLOCK = '#text'
+
+# أسماء الأصناف والمعرّفات الشائعة في مواقع الأخبار العربية لأجزاء ليست من متن الخبر
+# الكلمات مقيدة بحدود الكلمة حتى لا تطابق 'ad-' داخل 'lead-text' مثلًا
+NEGATIVE_PATTERN = re.compile(
+    r'\b(?:comments?|share|sharing|social|related|sidebar|widgets?|menu|breadcrumbs?|footer|header|navbar|nav|'
+    r'promo|advert\w*|ads?|banner|newsletter|subscribe|most-?read|popular|trending|tags|keywords|cookies?|'
+    r'popup|modal)\b',
+    re.IGNORECASE,
+)
+NEGATIVE_PENALTY = 25
+POSITIVE_PATTERN = re.compile(
+    r'article|story|content|entry|post-body|news-?body|news-?text|details|text-body|body-text|main',
+    re.IGNORECASE,
+)
+ARABIC_LETTERS = re.compile(r'[؀-ۿ]')
+PUNCTUATION = re.compile(r'[،,.؛؟!]')
+WHITESPACE = re.compile(r'\s+')
+
+MIN_BLOCK_CHARS = 25
+
+
+class _Node:
+    __slots__ = ('tag', 'parent', 'score', 'skipped', 'negative')
+
+    def __init__(self, tag, parent, score=0.0, skipped=False, negative=False):
+        self.tag = tag
+        self.parent = parent
+        self.score = score
+        self.skipped = skipped
+        self.negative = negative
+
+
+class _ArticleParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _Node('root', None)
+        self.stack = [self.root]
+        self.blocks = []  # (node, tag, text, link_chars)
+        self.block = None  # (node, parts, [link_chars], owner)
+        self.breaks = 0
+        self.title = ''
+        self.og_title = ''
+        self.in_title = False
+        self.in_link = 0
+
+    @property
+    def current(self):
+        return self.stack[-1]
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'meta':
+            if attrs.get('property') == 'og:title' or attrs.get('name') == 'twitter:title':
+                self.og_title = self.og_title or (attrs.get('content') or '').strip()
+            return
+        if tag in VOID_TAGS:
+            if tag == 'br' and self.block is not None:
+                self.breaks += 1
+                # سطران فارغان متتاليان يفصلان الفقرات في النص المكتوب مباشرة داخل الحاوية
+                if self.breaks >= 2 and self.block[0].tag == TEXT_BLOCK:
+                    self._close_block()
+                else:
+                    self.block[1].append(' ')
+            return
+        self.breaks = 0
+        if tag == 'title':
+            self.in_title = True
+        if self.block is not None and (
+            tag in BLOCK_TAGS or tag in CONTAINER_TAGS and self.block[0].tag == TEXT_BLOCK
+        ):
+            self._close_block()
+
+        hint = f"{attrs.get('class') or ''} {attrs.get('id') or ''}".strip()
+        positive = bool(hint) and bool(POSITIVE_PATTERN.search(hint))
+        negative = tag not in PROTECTED_TAGS and not positive and (
+            tag in NEGATIVE_TAGS or bool(hint) and bool(NEGATIVE_PATTERN.search(hint))
+        )
+        # التلميحات السلبية تخفض تقييم الحاوية بدل حذف كل ما بداخلها
+        node = _Node(tag, self.current, skipped=self.current.skipped or tag in SKIP_TAGS, negative=negative)
+        if tag == 'article':
+            node.score += 25
+        if positive:
+            node.score += 25
+        if negative:
+            node.score -= NEGATIVE_PENALTY
+        self.stack.append(node)
+
+        if tag == 'a':
+            self.in_link += 1
+        if tag in BLOCK_TAGS and not node.skipped and self.block is None:
+            self.block = (node, [], [0], node)
+
+    def handle_endtag(self, tag):
+        if tag == 'title':
+            self.in_title = False
+        if tag in VOID_TAGS:
+            return
+        # إغلاق الوسوم غير المغلقة حتى الوسم المطابق، وتجاهل الإغلاق الذي لا يطابق شيئًا
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                break
+        else:
+            return
+        while len(self.stack) > index:
+            node = self.stack.pop()
+            if node.tag == 'a':
+                self.in_link = max(0, self.in_link - 1)
+            if self.block is not None and self.block[3] is node:
+                self._close_block()
+
+    def handle_data(self, data):
+        if self.in_title:
+            self.title += data
+            return
+        if self.current.skipped:
+            return
+        if self.block is None:
+            if not data.strip():
+                return
+            self._open_text_block()
+        if data.strip():
+            self.breaks = 0
+        self.block[1].append(data)
+        if self.in_link:
+            self.block[2][0] += len(data.strip())
+
+    def _open_text_block(self):
+        # الفقرة الضمنية تنتهي بانتهاء أقرب حاوية أو فقرة تضمها، أو ببدء فقرة أو حاوية جديدة
+        owner = self.current
+        while owner.parent is not None and owner.tag not in CONTAINER_TAGS and owner.tag not in BLOCK_TAGS:
+            owner = owner.parent
+        self.block = (_Node(TEXT_BLOCK, self.current), [], [0], owner)
+
+    def _close_block(self):
+        node, parts, link_chars, _owner = self.block
+        self.block = None
+        text = WHITESPACE.sub(' ', ''.join(parts)).strip()
+        if text:
+            self.blocks.append((node, node.tag, text, link_chars[0]))
+
+    def close(self):
+        super().close()
+        if self.block is not None:
+            self._close_block()
+
+
+def _container_of(node):
+    parent = node.parent
+    while parent is not None and parent.tag not in CONTAINER_TAGS and parent.tag != 'root':
+        parent = parent.parent
+    return parent
+
+
+def _block_score(text, link_chars):
+    length = len(text)
+    if length < MIN_BLOCK_CHARS:
+        return 0.0
+    link_density = link_chars / length
+    if link_density > 0.5:
+        return 0.0
+    score = 1 + len(PUNCTUATION.findall(text)) + min(length / 100, 3)
+    # النصوص العربية الطويلة هي على الأرجح متن الخبر
+    if len(ARABIC_LETTERS.findall(text)) > length * 0.5:
+        score += 1
+    return score * (1 - link_density)
+
+
+def _inside_negative(node, container):
+    """
+    هل تقع الفقرة داخل عنصر سلبي (مشاركة، مواضيع ذات صلة...) بينها وبين الحاوية المختارة؟
+    يرجع None إذا لم تكن الفقرة داخل الحاوية أصلًا.
+    """
+    negative = False
+    while node is not None:
+        if node is container:
+            return negative
+        negative = negative or node.negative
+        node = node.parent
+    return None
+
+
+def extract_article(html):
+    """
+    استخراج عنوان الخبر ونصه الرئيسي من صفحة HTML على طريقة Readability:
+    تُقيَّم الحاويات حسب فقراتها، ثم تُجمع فقرات الحاوية الأعلى تقييمًا بالترتيب.
+    يرجع (title, text)، وقد يكون النص فارغًا إذا لم يوجد متن قابل للقراءة.
+    """
+    parser = _ArticleParser()
+    parser.feed(html)
+    parser.close()
+
+    title = parser.og_title or WHITESPACE.sub(' ', parser.title).strip()
+    candidates = {}
+    for node, _tag, text, link_chars in parser.blocks:
+        score = _block_score(text, link_chars)
+        if not score:
+            continue
+        container = _container_of(node)
+        if container is None:
+            continue
+        candidates[container] = candidates.get(container, container.score) + score
+        grandparent = _container_of(container)
+        if grandparent is not None:
+            candidates[grandparent] = candidates.get(grandparent, grandparent.score) + score / 2
+
+    if not candidates:
+        return title, ''
+    best = max(candidates, key=candidates.get)
+
+    lines = []
+    for node, tag, text, link_chars in parser.blocks:
+        inside_negative = _inside_negative(node, best)
+        # عنوان الخبر (h1) كثيرًا ما يكون داخل <header> في <article>، فلا نستبعده
+        if inside_negative is None or inside_negative and tag != 'h1':
+            continue
+        is_heading = tag in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+        if not is_heading and len(text) < MIN_BLOCK_CHARS and tag != 'li':
+            continue
+        if link_chars > len(text) * 0.5:
+            continue
+        if lines and lines[-1] == text:
+            continue
+        lines.append(text)
+
+    if not title:
+        title = next((text for _node, tag, text, _l in parser.blocks if tag == 'h1'), '')
+    return title, '\n\n'.join(lines)
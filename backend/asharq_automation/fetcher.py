@@ -0,0 +1,226 @@
+import ipaddress
+import re
+import socket
+import threading
+import time
+from datetime import timedelta
+from urllib.parse import urljoin, urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+from django.conf import settings
+from django.utils import timezone
+from .extraction import extract_article
+from .models import FetchedDocument
+
+USER_AGENT = "Mozilla/5.0 (compatible; MediaPlatformBot/1.0)"
+ALLOWED_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain')
+MAX_REDIRECTS = 5
+META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+
+class FetchError(Exception):
+    pass
+
+
+class URLRejected(FetchError):
+    """
+    الرابط نفسه غير مقبول (صيغة خاطئة، طويل جدًا، أو يشير إلى عنوان داخلي)، أي خطأ من العميل.
+    """
+
+
+def _check_address(ip):
+    if not settings.URL_FETCH_ALLOW_PRIVATE and not ip.is_global:
+        raise URLRejected(f"Refusing to fetch non-public address {ip}.")
+
+
+# يُفحص عنوان الطرف الآخر بعد الاتصال الفعلي أيضًا، لأن مضيفًا يغيّر نتيجة DNS بين الفحص
+# المسبق في _check_url والاتصال (DNS rebinding) قد يوصلنا إلى عنوان داخلي
+class _PeerCheckMixin:
+    def _new_conn(self):
+        sock = super()._new_conn()
+        try:
+            _check_address(ipaddress.ip_address(sock.getpeername()[0].split('%')[0]))
+        except Exception:
+            sock.close()
+            raise
+        return sock
+
+
+class _SafeHTTPConnection(_PeerCheckMixin, HTTPConnection):
+    pass
+
+
+class _SafeHTTPSConnection(_PeerCheckMixin, HTTPSConnection):
+    pass
+
+
+class _SafeHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _SafeHTTPConnection
+
+
+class _SafeHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _SafeHTTPSConnection
+
+
+class _SafeAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _SafeHTTPConnectionPool,
+            'https': _SafeHTTPSConnectionPool,
+        }
+
+
+# جلسة HTTP واحدة لكل عملية حتى يُعاد استخدام الاتصالات بين الطلبات
+_session = None
+_lock = threading.Lock()
+
+
+def get_session():
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                session = requests.Session()
+                # لا نمر عبر وكلاء البيئة حتى يبقى فحص عنوان الطرف الآخر فعّالًا
+                session.trust_env = False
+                retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                                allowed_methods=['GET'], redirect=False)
+                adapter = _SafeAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({
+                    'User-Agent': USER_AGENT,
+                    'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.5',
+                    'Accept-Language': 'ar,en;q=0.8',
+                })
+                _session = session
+    return _session
+
+
+def _check_url(url):
+    try:
+        parts = urlsplit(url)
+        hostname, port = parts.hostname, parts.port
+    except (ValueError, UnicodeError) as e:
+        raise URLRejected(f"Invalid URL: {e}")
+    if parts.scheme not in ('http', 'https') or not hostname:
+        raise URLRejected(f"Unsupported URL: {url}")
+    if settings.URL_FETCH_ALLOW_PRIVATE:
+        return
+    # منع جلب عناوين الشبكة الداخلية (SSRF)
+    try:
+        infos = socket.getaddrinfo(hostname, port, proto=socket.IPPROTO_TCP)
+    except (socket.gaierror, UnicodeError, ValueError) as e:
+        raise FetchError(f"Could not resolve {hostname}: {e}")
+    for info in infos:
+        _check_address(ipaddress.ip_address(info[4][0].split('%')[0]))
+
+
+def _check_deadline(deadline):
+    # مهلة القراءة في requests تخص كل قراءة على حدة، فخادم يرسل بايتات قليلة ببطء لا ينتهي أبدًا بدون مهلة كلية
+    if time.monotonic() > deadline:
+        raise FetchError(f"Fetching took longer than {settings.URL_FETCH_DEADLINE} seconds.")
+
+
+def _get(url, headers, deadline):
+    """
+    طلب GET متدفق مع متابعة التحويلات يدويًا حتى يُفحص كل عنوان قبل الاتصال به.
+    ترويسات التحقق الشرطي (headers) تخص الرابط الأصلي فقط، فلا تُرسل إلى عناوين التحويل.
+    """
+    session = get_session()
+    original_url = url
+    for _ in range(MAX_REDIRECTS + 1):
+        _check_deadline(deadline)
+        _check_url(url)
+        response = session.get(url, headers=headers if url == original_url else None, stream=True,
+                               allow_redirects=False, timeout=settings.URL_FETCH_TIMEOUT)
+        if response.is_redirect:
+            url = urljoin(url, response.headers['Location'])
+            response.close()
+            continue
+        return url, response
+    raise FetchError("Too many redirects.")
+
+
+def _read_limited(response, deadline):
+    # الصفحات الأكبر من الحد تُقتطع (سواء أعلنت Content-Length أم لا)، فمتن الخبر عادة في أولها
+    max_bytes = settings.URL_FETCH_MAX_BYTES
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=16384):
+        _check_deadline(deadline)
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= max_bytes:
+            break
+    return b''.join(chunks)[:max_bytes]
+
+
+def _decode(body, response):
+    encoding = requests.utils.get_encoding_from_headers(response.headers)
+    if not encoding or encoding.lower() == 'iso-8859-1':
+        # كثير من المواقع العربية تعلن الترميز (utf-8 أو windows-1256) في وسم meta فقط
+        match = META_CHARSET.search(body[:4096])
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return body.decode(encoding, errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+
+def fetch_document(url):
+    """
+    يجلب صفحة الخبر ويستخرج عنوانها ونصها الرئيسي، ويخزن النتيجة.
+    إذا كانت النسخة المخزنة حديثة تُعاد مباشرة، وإلا يُعاد الجلب بشكل مشروط
+    (If-None-Match / If-Modified-Since) ويُعاد استخدام النسخة المخزنة عند 304.
+    """
+    if not isinstance(url, str) or len(url) > FetchedDocument._meta.get_field('url').max_length:
+        raise URLRejected("URL must be a string of at most 500 characters.")
+    document = FetchedDocument.objects.filter(url=url).first()
+    if document and document.fetched_at >= timezone.now() - timedelta(seconds=settings.URL_FETCH_FRESH_SECONDS):
+        return document
+
+    headers = {}
+    if document:
+        if document.etag:
+            headers['If-None-Match'] = document.etag
+        if document.last_modified:
+            headers['If-Modified-Since'] = document.last_modified
+
+    deadline = time.monotonic() + settings.URL_FETCH_DEADLINE
+    try:
+        final_url, response = _get(url, headers, deadline)
+        with response:
+            if response.status_code == 304 and document:
+                document.save(update_fields=['fetched_at'])
+                return document
+            if response.status_code >= 400:
+                raise FetchError(f"Source returned HTTP {response.status_code}.")
+            content_type = response.headers.get('Content-Type', 'text/html').split(';')[0].strip().lower()
+            if content_type not in ALLOWED_CONTENT_TYPES:
+                raise FetchError(f"Unsupported content type: {content_type}")
+            html = _decode(_read_limited(response, deadline), response)
+            etag = response.headers.get('ETag', '')
+            last_modified = response.headers.get('Last-Modified', '')
+    except (requests.RequestException, ValueError, UnicodeError) as e:
+        raise FetchError(f"Could not fetch {url}: {e}")
+
+    if content_type == 'text/plain':
+        title, text = '', html.strip()
+    else:
+        title, text = extract_article(html)
+    if not text:
+        raise FetchError("No readable article text found at the URL.")
+
+    document, _ = FetchedDocument.objects.update_or_create(url=url, defaults={
+        'final_url': final_url[:500],
+        'etag': etag[:255],
+        'last_modified': last_modified[:64],
+        'title': title[:500],
+        'text': text,
+    })
+    return document
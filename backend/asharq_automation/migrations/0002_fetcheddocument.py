@@ -0,0 +1,26 @@
+# Generated by Django 4.2.24 on 2026-10-19 12:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('asharq_automation', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FetchedDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=500, unique=True)),
+                ('final_url', models.URLField(blank=True, max_length=500)),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('last_modified', models.CharField(blank=True, max_length=64)),
+                ('title', models.CharField(blank=True, max_length=500)),
+                ('text', models.TextField()),
+                ('fetched_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
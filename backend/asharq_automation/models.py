@@ -28,4 +28,17 @@ class GeneratedPost(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return f"{self.platform} post for article {self.article.id}"
\ No newline at end of file
+        return f"{self.platform} post for article {self.article.id}"
+
+# نسخة مخزنة من الصفحات التي جُلبت من روابط الأخبار، مع ترويسات ETag/Last-Modified لإعادة الجلب المشروط
+class FetchedDocument(models.Model):
+    url = models.URLField(max_length=500, unique=True)
+    final_url = models.URLField(max_length=500, blank=True)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    title = models.CharField(max_length=500, blank=True)
+    text = models.TextField()
+    fetched_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.url
@@ -1,3 +1,212 @@
-from django.test import TestCase
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from .extraction import extract_article
+from .fetcher import FetchError, URLRejected, fetch_document
+from .models import FetchedDocument
 
-# Create your tests here.
+LEAD = "قالت مصادر طبية في قطاع غزة، اليوم الأحد، إن عشرات الفلسطينيين استشهدوا في غارات على مناطق متفرقة."
+BODY = "وأضافت المصادر أن فرق الإسعاف ما زالت تبحث عن مفقودين تحت الأنقاض، في ظل نقص حاد في المعدات."
+
+ARTICLE_HTML = f"""<html><head><meta charset="utf-8"><title>الموقع | خبر</title>
+<meta property="og:title" content="غارات على غزة"></head>
+<body class="single has-sidebar"><header><nav><ul><li><a href="/">الرئيسية</a></li></ul></nav></header>
+<div class="container">
+<div class="sidebar"><p>الأكثر قراءة: خبر جانبي طويل جدًا لا علاقة له بالموضوع الأساسي هنا</p></div>
+<article class="article-with-header"><header><h1>غارات على غزة</h1></header>
+<p class="lead-text">{LEAD}</p>
+<p>{BODY}</p>
+<div class="share-buttons"><p>شارك الخبر على فيسبوك وتويتر وواتساب الآن مع أصدقائك</p></div>
+</article>
+<div class="related-news"><ul><li><a href="/1">خبر ذو صلة بعنوان طويل جدًا هنا للتجربة</a></li></ul></div>
+</div><footer><p>جميع الحقوق محفوظة لموقع الأخبار العربي 2025 وغير ذلك</p></footer></body></html>"""
+
+
+class ExtractArticleTests(TestCase):
+    def test_extracts_arabic_article_body(self):
+        title, text = extract_article(ARTICLE_HTML)
+        self.assertEqual(title, "غارات على غزة")
+        self.assertEqual(text.split("\n\n"), ["غارات على غزة", LEAD, BODY])
+
+    def test_noisy_wrapper_classes_do_not_hide_the_article(self):
+        for wrapper in ('<body class="single has-sidebar"><div>', '<body><div class="article-with-header">'):
+            html = f"<html><head><title>T</title></head>{wrapper}<p>{LEAD}</p><p>{BODY}</p></div></body></html>"
+            self.assertEqual(extract_article(html)[1], f"{LEAD}\n\n{BODY}")
+
+    def test_text_directly_inside_divs(self):
+        html = f'<div class="article-body">{LEAD}<br><br>{BODY}</div>'
+        self.assertEqual(extract_article(html), ('', f"{LEAD}\n\n{BODY}"))
+        html = (f'<body><div class="menu"><a href="/">الرئيسية</a> <a href="/news">الأخبار العاجلة اليوم</a></div>'
+                f'<div id="story"><div>{LEAD} <b>عاجل</b></div><div>{BODY}</div></div></body>')
+        self.assertEqual(extract_article(html)[1], f"{LEAD} عاجل\n\n{BODY}")
+
+    def test_page_without_article_text(self):
+        self.assertEqual(extract_article("<html><head><title>T</title></head><body></body></html>"), ('T', ''))
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    pages = {}
+    hits = []
+
+    def do_GET(self):
+        self.hits.append((self.path, self.headers.get('If-None-Match')))
+        page = self.pages.get(self.path)
+        if page is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        if 'location' in page:
+            self.send_response(302)
+            self.send_header('Location', page['location'])
+            self.end_headers()
+            return
+        if page.get('etag') and self.headers.get('If-None-Match') == page['etag']:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', page.get('content_type', 'text/html; charset=utf-8'))
+        if page.get('etag'):
+            self.send_header('ETag', page['etag'])
+        self.send_header('Content-Length', str(len(page['body'])))
+        self.end_headers()
+        try:
+            # الصفحات البطيئة تُرسل على أجزاء مع انتظار بينها
+            step = 16384 if page.get('delay') else len(page['body'])
+            for offset in range(0, len(page['body']), step):
+                self.wfile.write(page['body'][offset:offset + step])
+                self.wfile.flush()
+                time.sleep(page.get('delay', 0))
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(URL_FETCH_ALLOW_PRIVATE=True, URL_FETCH_FRESH_SECONDS=0)
+class FetchDocumentTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _StandIn)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        _StandIn.hits = []
+        _StandIn.pages = {
+            '/article': {'body': ARTICLE_HTML.encode('utf-8'), 'etag': '"v1"'},
+            '/old': {'location': '/moved'},
+            '/moved': {'location': '/article'},
+            '/loop': {'location': '/loop'},
+            '/cp1256': {
+                'body': f'<html><head><meta charset="windows-1256"></head><body><p>{LEAD}</p></body></html>'.encode('cp1256'),
+                'content_type': 'text/html',
+            },
+            '/big': {'body': f"<html><body><p>{LEAD}</p><p>END-MARKER {BODY}</p></body></html>".encode('utf-8')},
+            '/image': {'body': b'GIF89a', 'content_type': 'image/gif'},
+            '/slow': {'body': f"<html><body><p>{LEAD}</p></body></html>".encode('utf-8').ljust(16384 * 8), 'delay': 0.3},
+        }
+
+    def test_follows_redirect_chain(self):
+        document = fetch_document(f"{self.base}/old")
+        self.assertEqual(document.final_url, f"{self.base}/article")
+        self.assertEqual(document.title, "غارات على غزة")
+        self.assertIn(LEAD, document.text)
+        self.assertEqual([path for path, _ in _StandIn.hits], ['/old', '/moved', '/article'])
+
+    def test_validators_are_not_sent_to_redirect_targets(self):
+        fetch_document(f"{self.base}/old")
+        _StandIn.hits = []
+        fetch_document(f"{self.base}/old")
+        self.assertEqual(_StandIn.hits, [('/old', '"v1"'), ('/moved', None), ('/article', None)])
+
+    @override_settings(URL_FETCH_DEADLINE=0.5)
+    def test_slow_source_hits_overall_deadline(self):
+        started = time.monotonic()
+        with self.assertRaises(FetchError):
+            fetch_document(f"{self.base}/slow")
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_too_many_redirects(self):
+        with self.assertRaises(FetchError):
+            fetch_document(f"{self.base}/loop")
+
+    def test_etag_revalidation_reuses_stored_copy(self):
+        first = fetch_document(f"{self.base}/article")
+        FetchedDocument.objects.filter(pk=first.pk).update(text='النسخة المخزنة')
+        second = fetch_document(f"{self.base}/article")
+        self.assertEqual(second.text, 'النسخة المخزنة')
+        self.assertEqual(_StandIn.hits, [('/article', None), ('/article', '"v1"')])
+
+    @override_settings(URL_FETCH_FRESH_SECONDS=300)
+    def test_fresh_copy_skips_network(self):
+        fetch_document(f"{self.base}/article")
+        fetch_document(f"{self.base}/article")
+        self.assertEqual(len(_StandIn.hits), 1)
+
+    def test_large_page_is_truncated(self):
+        body = _StandIn.pages['/big']['body']
+        with override_settings(URL_FETCH_MAX_BYTES=body.index(b'END-MARKER')):
+            document = fetch_document(f"{self.base}/big")
+        self.assertIn(LEAD, document.text)
+        self.assertNotIn('END-MARKER', document.text)
+
+    def test_decodes_windows_1256_meta_charset(self):
+        self.assertEqual(fetch_document(f"{self.base}/cp1256").text, LEAD)
+
+    def test_rejects_unsupported_content_and_http_errors(self):
+        with self.assertRaises(FetchError):
+            fetch_document(f"{self.base}/image")
+        with self.assertRaises(FetchError):
+            fetch_document(f"{self.base}/missing")
+
+    @override_settings(URL_FETCH_ALLOW_PRIVATE=False)
+    def test_refuses_non_public_addresses(self):
+        with self.assertRaises(URLRejected):
+            fetch_document(f"{self.base}/article")
+        with self.assertRaises(URLRejected):
+            fetch_document(f"http://localhost:{self.server.server_port}/article")
+        self.assertEqual(_StandIn.hits, [])
+
+    @override_settings(URL_FETCH_ALLOW_PRIVATE=False)
+    def test_checks_peer_address_after_dns_resolution(self):
+        # محاكاة DNS rebinding: الفحص المسبق ينجح لكن الاتصال الفعلي يصل إلى عنوان داخلي
+        with mock.patch('asharq_automation.fetcher._check_url'):
+            with self.assertRaises(URLRejected):
+                fetch_document(f"{self.base}/article")
+        self.assertEqual(_StandIn.hits, [])
+
+    def test_rejects_malformed_urls(self):
+        for url in ('ftp://example.com/x', 'http://example.com:99999/', f"http://example.com/{'a' * 600}", 5):
+            with self.assertRaises(URLRejected):
+                fetch_document(url)
+
+
+class ProcessAndGenerateFetchErrorTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('editor', 'editor@example.com', 'pw'))
+
+    def post(self, url):
+        return self.client.post('/api/asharq-automation/articles/process-and-generate/',
+                                {'url': url, 'platforms': ['X']}, format='json')
+
+    def test_invalid_url_is_a_client_error(self):
+        self.assertEqual(self.post('http://example.com:99999/').status_code, 400)
+        self.assertEqual(self.post('http://127.0.0.1/').status_code, 400)
+
+    def test_upstream_failure_is_a_bad_gateway(self):
+        with mock.patch('asharq_automation.views.fetch_document', side_effect=FetchError("Source returned HTTP 404.")):
+            self.assertEqual(self.post('https://example.com/news').status_code, 502)
@@ -4,19 +4,14 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from .models import NewsArticle, GeneratedPost
 from .serializers import NewsArticleSerializer, GeneratedPostSerializer
+from retention.models import ArchivedNewsArticle
+from django.http import Http404
+from rest_framework.generics import get_object_or_404
+from core.gemini import get_model
 from django.conf import settings
-import google.generativeai as genai
+from .fetcher import fetch_document, FetchError, URLRejected
 import json
 
-# تهيئة Gemini
-try:
-    if settings.GEMINI_API_KEY:
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-    else:
-        print("Warning: GEMINI_API_KEY not found in settings.")
-except Exception as e:
-    print(f"Warning: Gemini API key not configured. Error: {e}")
-
 class NewsArticleViewSet(viewsets.ModelViewSet):
     serializer_class = NewsArticleSerializer
     permission_classes = [IsAuthenticated]
@@ -27,6 +22,17 @@ class NewsArticleViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    def retrieve(self, request, *args, **kwargs):
+        # المقالات القديمة تنقل إلى الأرشيف، لكنها تبقى قابلة للقراءة من نفس الرابط
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            archived = get_object_or_404(
+                ArchivedNewsArticle.objects.prefetch_related('posts'),
+                pk=kwargs['pk'], user=request.user
+            )
+            return Response(self.get_serializer(archived).data)
+
     @action(detail=False, methods=['post'], url_path='process-and-generate')
     def process_and_generate(self, request):
         """
@@ -41,11 +47,25 @@ class NewsArticleViewSet(viewsets.ModelViewSet):
         if not (source_url or original_text) or not platforms:
             return Response({"error": "URL/text and platforms are required."}, status=status.HTTP_400_BAD_REQUEST)
 
+        # 0. جلب الرابط من الخادم واستخراج نص الخبر، بدل إرسال الرابط وحده إلى النموذج
+        document = None
+        if source_url and not original_text:
+            try:
+                document = fetch_document(source_url)
+            except URLRejected as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+            except FetchError as e:
+                return Response({"error": str(e)}, status=status.HTTP_502_BAD_GATEWAY)
+
         try:
-            model = genai.GenerativeModel("gemini-1.5-flash")
+            model = get_model()
             
             # 1. تحليل وتلخيص الخبر
-            content_to_parse = f"URL: {source_url}" if source_url else f'Text: "{original_text}"'
+            if document:
+                article_text = document.text[:settings.URL_FETCH_MAX_CHARS]
+                content_to_parse = f'Title: {document.title}\nText: "{article_text}"'
+            else:
+                content_to_parse = f'Text: "{original_text}"'
             parsing_prompt = f"""
             Analyze the provided news content. Your output must be a clean JSON object with keys: "headline", "summary", and "entities".
             Content: {content_to_parse}
@@ -57,7 +77,7 @@ class NewsArticleViewSet(viewsets.ModelViewSet):
             article = NewsArticle.objects.create(
                 user=request.user,
                 source_url=source_url,
-                original_text=original_text or parsed_data.get('summary', ''),
+                original_text=original_text or (document.text if document else parsed_data.get('summary', '')),
                 topic=brand_id # Use brandId as topic
             )
 
@@ -41,7 +41,10 @@ INSTALLED_APPS = [
     'applications',
     'tasks',
     'style_editor_data',
-    'asharq_automation'
+    'asharq_automation',
+    'retention',
+    'core',
+    'subtitles'
 ]
 
 MIDDLEWARE = [
@@ -97,6 +100,22 @@ USE_TZ = True
 STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# سياسات الاحتفاظ: الصفوف الأقدم من عدد الأيام تنقل إلى جداول الأرشيف المضغوطة
+RETENTION_CODEC = os.environ.get('RETENTION_CODEC', 'zlib')
+RETENTION_CHUNK_SIZE = int(os.environ.get('RETENTION_CHUNK_SIZE', 500))
+RETENTION_POLICIES = {
+    'asharq_automation.NewsArticle': {'days': int(os.environ.get('RETENTION_ARTICLE_DAYS', 365))},
+    'tasks.Task': {'days': int(os.environ.get('RETENTION_TASK_DAYS', 180))},
+}
+
+# جلب روابط الأخبار من الخادم قبل إرسالها إلى Gemini
+URL_FETCH_TIMEOUT = (5, 15)  # (connect, read) بالثواني
+URL_FETCH_DEADLINE = float(os.environ.get('URL_FETCH_DEADLINE', 20))  # أقصى مدة للجلب كاملًا مع التحويلات
+URL_FETCH_MAX_BYTES = int(os.environ.get('URL_FETCH_MAX_BYTES', 2 * 1024 * 1024))
+URL_FETCH_MAX_CHARS = int(os.environ.get('URL_FETCH_MAX_CHARS', 12000))
+URL_FETCH_FRESH_SECONDS = int(os.environ.get('URL_FETCH_FRESH_SECONDS', 300))
+URL_FETCH_ALLOW_PRIVATE = os.environ.get('URL_FETCH_ALLOW_PRIVATE') == 'true'
+
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
@@ -16,4 +16,5 @@ urlpatterns = [
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('health/', health_check, name='health_check'),
     path('api/asharq-automation/', include('asharq_automation.urls')),
+    path('api/subtitles/', include('subtitles.urls')),
 ]
\ No newline at end of file
@@ -0,0 +1,37 @@
+import threading
+from django.conf import settings
+
+DEFAULT_MODEL = "gemini-1.5-flash"
+
+# مكتبة Gemini ثقيلة، لذلك لا تستورد ولا تهيأ إلا عند أول استخدام فعلي
+# حتى لا تدفع أوامر manage.py والترحيلات وإقلاع gunicorn ثمن استيرادها.
+_genai = None
+_lock = threading.Lock()
+
+
+def get_genai():
+    global _genai
+    if _genai is None:
+        with _lock:
+            if _genai is None:
+                import google.generativeai as genai
+                try:
+                    if settings.GEMINI_API_KEY:
+                        genai.configure(api_key=settings.GEMINI_API_KEY)
+                    else:
+                        print("Warning: GEMINI_API_KEY not found in settings.")
+                except Exception as e:
+                    print(f"Warning: Gemini API key not configured. Error: {e}")
+                _genai = genai
+    return _genai
+
+
+def get_model(name=DEFAULT_MODEL):
+    return get_genai().GenerativeModel(name)
+
+
+def warm_up():
+    """
+    يستورد ويهيئ Gemini مسبقًا (مثلًا بعد fork في عامل gunicorn) حتى لا يدفع أول طلب الثمن.
+    """
+    get_genai()
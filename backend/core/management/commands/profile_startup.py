@@ -0,0 +1,121 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# مكتبات يجب ألا تستورد أثناء الإقلاع، بل عند أول استخدام فقط
+LAZY_MODULES = ['google.generativeai']
+
+RESULT_MARKER = 'STARTUP_PROFILE '
+
+# يعمل في عملية جديدة: يحمّل تطبيق WSGI ثم يخدم طلبًا واحدًا ويطبع النتائج
+PROBE = '''
+import io, json, os, sys, time
+start = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+ready = time.perf_counter()
+from django.conf import settings
+host = next((h for h in settings.ALLOWED_HOSTS if not h.startswith('.') and h != '*'), 'localhost')
+environ = {
+    'REQUEST_METHOD': 'GET', 'PATH_INFO': sys.argv[1], 'QUERY_STRING': '',
+    'SERVER_NAME': host, 'SERVER_PORT': '443', 'HTTP_HOST': host, 'SERVER_PROTOCOL': 'HTTP/1.1',
+    'wsgi.version': (1, 0), 'wsgi.url_scheme': 'https', 'wsgi.input': io.BytesIO(),
+    'wsgi.errors': sys.stderr, 'wsgi.multithread': False, 'wsgi.multiprocess': False, 'wsgi.run_once': True,
+}
+statuses = []
+body = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+b''.join(body)
+if hasattr(body, 'close'):
+    body.close()
+done = time.perf_counter()
+print(%r + json.dumps({
+    'setup_ms': (ready - start) * 1000,
+    'first_request_ms': (done - ready) * 1000,
+    'status': statuses[0] if statuses else None,
+    'modules': sorted(sys.modules),
+}), flush=True)
+''' % RESULT_MARKER
+
+
+def parse_importtime(stderr):
+    """
+    يحوّل مخرجات python -X importtime إلى مجموع الوقت الذاتي (بالميكروثانية) لكل حزمة عليا.
+    """
+    totals = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, _cumulative, name = line[len('import time:'):].split('|')
+            totals[name.strip().split('.')[0]] += int(self_us)
+        except ValueError:
+            continue
+    return totals
+
+
+class Command(BaseCommand):
+    help = "Report the import-time breakdown and time-to-first-request of a fresh process."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/health/', help="URL path used for the first request.")
+        parser.add_argument('--top', type=int, default=15, help="Number of packages to list.")
+        parser.add_argument('--budget-ms', type=float,
+                            help="Fail if time-to-first-request exceeds this many milliseconds.")
+        parser.add_argument('--strict', action='store_true',
+                            help="Fail if a lazily-loaded SDK was imported during startup.")
+        parser.add_argument('--json', action='store_true', help="Print the report as JSON.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', PROBE, options['path']],
+            cwd=settings.BASE_DIR, env=os.environ.copy(), capture_output=True, text=True,
+        )
+        total_ms = (time.perf_counter() - started) * 1000
+
+        lines = [line for line in proc.stdout.splitlines() if line.startswith(RESULT_MARKER)]
+        if proc.returncode != 0 or not lines:
+            tail = '\n'.join(line for line in proc.stderr.splitlines() if not line.startswith('import time:'))
+            raise CommandError(f"Startup probe failed:\n{tail[-2000:]}")
+
+        result = json.loads(lines[-1][len(RESULT_MARKER):])
+        totals = parse_importtime(proc.stderr)
+        eager = [name for name in LAZY_MODULES if name in result['modules']]
+        report = {
+            'time_to_first_request_ms': round(total_ms, 1),
+            'setup_ms': round(result['setup_ms'], 1),
+            'first_request_ms': round(result['first_request_ms'], 1),
+            'first_request_status': result['status'],
+            'import_ms': round(sum(totals.values()) / 1000, 1),
+            'packages': [
+                {'package': name, 'self_ms': round(us / 1000, 1)}
+                for name, us in sorted(totals.items(), key=lambda item: -item[1])[:options['top']]
+            ],
+            'eager_lazy_modules': eager,
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.stdout.write(f"Time to first request: {report['time_to_first_request_ms']} ms")
+            self.stdout.write(f"  django setup:        {report['setup_ms']} ms")
+            self.stdout.write(f"  first request:       {report['first_request_ms']} ms ({report['first_request_status']})")
+            self.stdout.write(f"  total import time:   {report['import_ms']} ms")
+            self.stdout.write("Slowest packages (self import time):")
+            for entry in report['packages']:
+                self.stdout.write(f"  {entry['self_ms']:>9} ms  {entry['package']}")
+            if eager:
+                self.stdout.write(self.style.WARNING(f"Imported at startup: {', '.join(eager)}"))
+
+        if options['strict'] and eager:
+            raise CommandError(f"Lazy modules imported during startup: {', '.join(eager)}")
+        if options['budget_ms'] is not None and total_ms > options['budget_ms']:
+            raise CommandError(
+                f"Time to first request {total_ms:.1f} ms exceeds budget of {options['budget_ms']} ms."
+            )
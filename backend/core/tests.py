@@ -0,0 +1,27 @@
+import json
+from io import StringIO
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from .management.commands.profile_startup import parse_importtime
+
+
+class ParseImporttimeTests(SimpleTestCase):
+    def test_sums_self_time_per_top_level_package(self):
+        stderr = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   django.utils",
+            "import time:        80 |        200 | django",
+            "import time:        50 |         50 |     rest_framework.fields",
+            "Traceback noise that is not importtime output",
+        ])
+        self.assertEqual(dict(parse_importtime(stderr)), {'django': 200, 'rest_framework': 50})
+
+
+class ProfileStartupTests(SimpleTestCase):
+    def test_gemini_sdk_is_not_imported_at_startup(self):
+        # يفشل الأمر (CommandError) إذا استُورد google.generativeai أثناء الإقلاع
+        out = StringIO()
+        call_command('profile_startup', strict=True, json=True, stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['eager_lazy_modules'], [])
+        self.assertEqual(report['first_request_status'], '200 OK')
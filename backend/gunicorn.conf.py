@@ -0,0 +1,8 @@
+import os
+
+
+def post_worker_init(worker):
+    # تهيئة Gemini مسبقًا في كل عامل بعد تحميل التطبيق، عند تفعيلها فقط
+    if os.environ.get('GEMINI_WARMUP') == 'true':
+        from core.gemini import warm_up
+        warm_up()
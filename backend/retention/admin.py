@@ -0,0 +1,34 @@
+from django.contrib import admin
+from .models import ArchivedNewsArticle, ArchivedGeneratedPost, ArchivedTask
+
+# الأرشيف للقراءة فقط: النصوص مضغوطة ولا تُعدّل من لوحة الإدارة
+class ReadOnlyArchiveAdmin(admin.ModelAdmin):
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+@admin.register(ArchivedNewsArticle)
+class ArchivedNewsArticleAdmin(ReadOnlyArchiveAdmin):
+    list_display = ('id', 'topic', 'user', 'source_url', 'created_at', 'archived_at')
+    list_filter = ('topic', 'created_at')
+    search_fields = ('source_url', 'user__username')
+    list_select_related = ('user',)
+    exclude = ('original_text_blob',)
+    readonly_fields = ('original_text',)
+
+@admin.register(ArchivedGeneratedPost)
+class ArchivedGeneratedPostAdmin(ReadOnlyArchiveAdmin):
+    list_display = ('id', 'platform', 'article_id', 'status', 'created_at', 'archived_at')
+    list_filter = ('platform', 'status', 'created_at')
+    exclude = ('content_blob',)
+    readonly_fields = ('content',)
+
+@admin.register(ArchivedTask)
+class ArchivedTaskAdmin(ReadOnlyArchiveAdmin):
+    list_display = ('id', 'user', 'application', 'status', 'created_at', 'archived_at')
+    list_filter = ('status', 'created_at')
+    list_select_related = ('user', 'application')
+    exclude = ('input_text_blob', 'output_text_blob')
+    readonly_fields = ('input_text', 'output_text')
@@ -0,0 +1,131 @@
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from asharq_automation.models import NewsArticle, GeneratedPost
+from tasks.models import Task
+from .compression import compress_text, resolve_codec
+from .models import ArchivedNewsArticle, ArchivedGeneratedPost, ArchivedTask
+from .partitions import ensure_monthly_partitions
+
+
+class ArchiveConflict(Exception):
+    pass
+
+
+def _check_not_archived(archive_model, ids):
+    # لا نحذف صفًا أصليًا أبدًا إذا كان معرّفه موجودًا مسبقًا في الأرشيف، فذلك يعني فقدان بيانات
+    existing = sorted(archive_model.objects.filter(id__in=ids).values_list('id', flat=True))
+    if existing:
+        raise ArchiveConflict(
+            f"{archive_model.__name__} already contains ids {existing[:10]}; refusing to archive them again."
+        )
+
+
+def archive_news_articles(articles, codec):
+    # المنشورات تُؤرشف مع مقالها حتى تبقى صفحة تفاصيل المقال كاملة
+    article_ids = [article.id for article in articles]
+    posts = list(GeneratedPost.objects.filter(article_id__in=article_ids))
+    _check_not_archived(ArchivedNewsArticle, article_ids)
+    _check_not_archived(ArchivedGeneratedPost, [post.id for post in posts])
+
+    ensure_monthly_partitions(connection, ArchivedNewsArticle, [a.created_at for a in articles])
+    ensure_monthly_partitions(connection, ArchivedGeneratedPost, [p.created_at for p in posts])
+
+    ArchivedNewsArticle.objects.bulk_create([
+        ArchivedNewsArticle(
+            id=article.id,
+            user_id=article.user_id,
+            source_url=article.source_url,
+            topic=article.topic,
+            codec=codec,
+            original_text_blob=compress_text(article.original_text, codec),
+            created_at=article.created_at,
+        )
+        for article in articles
+    ])
+    ArchivedGeneratedPost.objects.bulk_create([
+        ArchivedGeneratedPost(
+            id=post.id,
+            article_id=post.article_id,
+            platform=post.platform,
+            status=post.status,
+            codec=codec,
+            content_blob=compress_text(post.content, codec),
+            created_at=post.created_at,
+        )
+        for post in posts
+    ])
+
+    GeneratedPost.objects.filter(article_id__in=article_ids).delete()
+    NewsArticle.objects.filter(id__in=article_ids).delete()
+
+
+def archive_tasks(tasks, codec):
+    _check_not_archived(ArchivedTask, [task.id for task in tasks])
+    ensure_monthly_partitions(connection, ArchivedTask, [t.created_at for t in tasks])
+
+    ArchivedTask.objects.bulk_create([
+        ArchivedTask(
+            id=task.id,
+            user_id=task.user_id,
+            application_id=task.application_id,
+            status=task.status,
+            codec=codec,
+            input_text_blob=compress_text(task.input_text, codec),
+            output_text_blob=compress_text(task.output_text, codec),
+            created_at=task.created_at,
+        )
+        for task in tasks
+    ])
+
+    Task.objects.filter(id__in=[task.id for task in tasks]).delete()
+
+
+# لكل نموذج قابل للأرشفة: النموذج الأصلي ودالة نقل دفعة من صفوفه
+ARCHIVERS = {
+    'asharq_automation.NewsArticle': (NewsArticle, archive_news_articles),
+    'tasks.Task': (Task, archive_tasks),
+}
+
+
+def run_policy(label, days=None, chunk_size=None, codec=None, dry_run=False, pause=0):
+    """
+    ينقل صفوف النموذج الأقدم من عدد الأيام المحدد إلى جداول الأرشيف على دفعات.
+    كل دفعة في معاملة قصيرة مستقلة حتى لا تبقى الأقفال على الجداول الساخنة طويلًا.
+    يرجع عدد الصفوف المؤرشفة (أو المرشحة للأرشفة عند dry_run).
+    """
+    if label not in ARCHIVERS:
+        raise ValueError(f"No archiver registered for {label}.")
+    if days is None:
+        days = settings.RETENTION_POLICIES.get(label, {}).get('days')
+        if not days:
+            return 0
+    if days < 1:
+        # فترة سالبة أو صفرية تجعل الحد في المستقبل فتؤرشف كل الصفوف
+        raise ValueError(f"Retention period for {label} must be at least 1 day.")
+
+    model, archive_chunk = ARCHIVERS[label]
+    chunk_size = chunk_size or settings.RETENTION_CHUNK_SIZE
+    codec = resolve_codec(codec or settings.RETENTION_CODEC)
+    cutoff = timezone.now() - timedelta(days=days)
+    queryset = model.objects.filter(created_at__lt=cutoff).order_by('pk')
+
+    if dry_run:
+        return queryset.count()
+
+    archived = 0
+    while True:
+        with transaction.atomic():
+            chunk_qs = queryset
+            if connection.features.has_select_for_update_skip_locked:
+                chunk_qs = chunk_qs.select_for_update(skip_locked=True)
+            rows = list(chunk_qs[:chunk_size])
+            if not rows:
+                break
+            archive_chunk(rows, codec)
+        archived += len(rows)
+        if pause:
+            time.sleep(pause)
+    return archived
@@ -0,0 +1,42 @@
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CODEC_ZLIB = 'zlib'
+CODEC_ZSTD = 'zstd'
+CODEC_CHOICES = [(CODEC_ZLIB, 'zlib'), (CODEC_ZSTD, 'zstd')]
+
+
+def resolve_codec(codec):
+    """
+    يتحقق من أن الترميز المطلوب معروف ومتاح. طلب zstd بدون مكتبة zstandard خطأ صريح
+    بدل الرجوع بصمت إلى zlib، حتى لا يظن المشغّل أن الأرشيف مضغوط بالترميز الذي اختاره.
+    """
+    if codec not in (CODEC_ZLIB, CODEC_ZSTD):
+        raise ValueError(f"Unknown retention codec: {codec}")
+    if codec == CODEC_ZSTD and zstandard is None:
+        raise ValueError("The zstd codec requires the zstandard package (pip install zstandard).")
+    return codec
+
+
+def compress_text(text, codec):
+    if text is None:
+        return None
+    data = text.encode('utf-8')
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return zlib.compress(data, 9)
+
+
+def decompress_text(blob, codec):
+    if blob is None:
+        return None
+    blob = bytes(blob)
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-compressed archives.")
+        return zstandard.ZstdDecompressor().decompress(blob).decode('utf-8')
+    return zlib.decompress(blob).decode('utf-8')
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from retention.archivers import ARCHIVERS, ArchiveConflict, run_policy
+
+
+class Command(BaseCommand):
+    help = "Move rows older than the configured retention period into compressed archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', action='append', dest='models', choices=sorted(ARCHIVERS),
+                            help="Model label to archive (repeatable). Defaults to every configured policy.")
+        parser.add_argument('--days', type=int, help="Override the retention period in days.")
+        parser.add_argument('--chunk-size', type=int, help="Rows moved per transaction.")
+        parser.add_argument('--codec', choices=['zlib', 'zstd'], help="Compression codec for archived text.")
+        parser.add_argument('--pause', type=float, default=0, help="Seconds to sleep between chunks.")
+        parser.add_argument('--dry-run', action='store_true', help="Only report how many rows would be archived.")
+
+    def handle(self, *args, **options):
+        labels = options['models'] or [label for label in ARCHIVERS if label in settings.RETENTION_POLICIES]
+        for label in labels:
+            try:
+                count = run_policy(
+                    label,
+                    days=options['days'],
+                    chunk_size=options['chunk_size'],
+                    codec=options['codec'],
+                    dry_run=options['dry_run'],
+                    pause=options['pause'],
+                )
+            except (ValueError, ArchiveConflict) as e:
+                raise CommandError(str(e))
+            verb = "would be archived" if options['dry_run'] else "archived"
+            self.stdout.write(self.style.SUCCESS(f"{label}: {count} rows {verb}."))
@@ -0,0 +1,78 @@
+# Generated by Django 4.2.24 on 2026-10-19 12:10
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from retention.partitions import create_archive_table
+
+ARCHIVE_MODELS = ['ArchivedNewsArticle', 'ArchivedGeneratedPost', 'ArchivedTask']
+
+
+def create_archive_tables(apps, schema_editor):
+    # الجداول تُنشأ هنا يدويًا لأن المقسّمة منها تحتاج مفتاحًا أساسيًا مركبًا (id, created_at)
+    # على PostgreSQL تُنشأ الجداول مقسّمة حسب created_at، وعلى غيره تُنشأ عادية
+    for name in ARCHIVE_MODELS:
+        create_archive_table(schema_editor, apps.get_model('retention', name))
+
+
+def drop_archive_tables(apps, schema_editor):
+    for name in reversed(ARCHIVE_MODELS):
+        schema_editor.delete_model(apps.get_model('retention', name))
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('applications', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='ArchivedNewsArticle',
+                    fields=[
+                        ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                        ('source_url', models.URLField(blank=True, max_length=500, null=True)),
+                        ('topic', models.CharField(max_length=100)),
+                        ('codec', models.CharField(choices=[('zlib', 'zlib'), ('zstd', 'zstd')], default='zlib', max_length=8)),
+                        ('original_text_blob', models.BinaryField()),
+                        ('created_at', models.DateTimeField()),
+                        ('archived_at', models.DateTimeField(auto_now_add=True)),
+                        ('user', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                    ],
+                ),
+                migrations.CreateModel(
+                    name='ArchivedGeneratedPost',
+                    fields=[
+                        ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                        ('platform', models.CharField(max_length=50)),
+                        ('status', models.CharField(max_length=20)),
+                        ('codec', models.CharField(choices=[('zlib', 'zlib'), ('zstd', 'zstd')], default='zlib', max_length=8)),
+                        ('content_blob', models.BinaryField()),
+                        ('created_at', models.DateTimeField()),
+                        ('archived_at', models.DateTimeField(auto_now_add=True)),
+                        ('article', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='posts', to='retention.archivednewsarticle')),
+                    ],
+                ),
+                migrations.CreateModel(
+                    name='ArchivedTask',
+                    fields=[
+                        ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                        ('status', models.CharField(max_length=10)),
+                        ('codec', models.CharField(choices=[('zlib', 'zlib'), ('zstd', 'zstd')], default='zlib', max_length=8)),
+                        ('input_text_blob', models.BinaryField(blank=True, null=True)),
+                        ('output_text_blob', models.BinaryField(blank=True, null=True)),
+                        ('created_at', models.DateTimeField()),
+                        ('archived_at', models.DateTimeField(auto_now_add=True)),
+                        ('application', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, to='applications.application')),
+                        ('user', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                    ],
+                ),
+            ],
+        ),
+        migrations.RunPython(create_archive_tables, drop_archive_tables),
+    ]
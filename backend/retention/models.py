@@ -0,0 +1,66 @@
+from django.db import models
+from django.contrib.auth.models import User
+from applications.models import Application
+from .compression import CODEC_CHOICES, CODEC_ZLIB, decompress_text
+
+# جداول الأرشيف: تحتفظ بنفس المعرّفات الأصلية، والنصوص الطويلة مخزنة مضغوطة.
+# على PostgreSQL تُنشأ هذه الجداول مقسّمة (range partitions) حسب created_at،
+# لذلك لا نستخدم قيود المفاتيح الأجنبية على مستوى قاعدة البيانات.
+
+class ArchivedNewsArticle(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_constraint=False)
+    source_url = models.URLField(max_length=500, blank=True, null=True)
+    topic = models.CharField(max_length=100)
+    codec = models.CharField(max_length=8, choices=CODEC_CHOICES, default=CODEC_ZLIB)
+    original_text_blob = models.BinaryField()
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    @property
+    def original_text(self):
+        return decompress_text(self.original_text_blob, self.codec)
+
+    def __str__(self):
+        return f"Archived article {self.id} on {self.topic}"
+
+
+class ArchivedGeneratedPost(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    article = models.ForeignKey(ArchivedNewsArticle, on_delete=models.CASCADE, related_name='posts', db_constraint=False)
+    platform = models.CharField(max_length=50)
+    status = models.CharField(max_length=20)
+    codec = models.CharField(max_length=8, choices=CODEC_CHOICES, default=CODEC_ZLIB)
+    content_blob = models.BinaryField()
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    @property
+    def content(self):
+        return decompress_text(self.content_blob, self.codec)
+
+    def __str__(self):
+        return f"Archived {self.platform} post for article {self.article_id}"
+
+
+class ArchivedTask(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_constraint=False)
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, db_constraint=False)
+    status = models.CharField(max_length=10)
+    codec = models.CharField(max_length=8, choices=CODEC_CHOICES, default=CODEC_ZLIB)
+    input_text_blob = models.BinaryField(blank=True, null=True)
+    output_text_blob = models.BinaryField(blank=True, null=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    @property
+    def input_text(self):
+        return decompress_text(self.input_text_blob, self.codec)
+
+    @property
+    def output_text(self):
+        return decompress_text(self.output_text_blob, self.codec)
+
+    def __str__(self):
+        return f"Archived task {self.id}"
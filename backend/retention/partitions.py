@@ -0,0 +1,68 @@
+from datetime import datetime, timezone as dt_timezone
+
+PARTITION_KEY = 'created_at'
+
+
+def supports_partitioning(connection):
+    return connection.vendor == 'postgresql'
+
+
+def create_partitioned_table(schema_editor, model):
+    """
+    ينشئ جدول أرشيف مقسّمًا حسب created_at على PostgreSQL.
+    المفتاح الأساسي يجب أن يشمل عمود التقسيم، لذلك يصبح (id, created_at).
+    """
+    connection = schema_editor.connection
+    qn = schema_editor.quote_name
+    table = model._meta.db_table
+
+    columns = []
+    for field in model._meta.local_fields:
+        null = 'NULL' if field.null else 'NOT NULL'
+        columns.append(f"{qn(field.column)} {field.db_type(connection)} {null}")
+    columns.append(f"PRIMARY KEY ({qn(model._meta.pk.column)}, {qn(PARTITION_KEY)})")
+
+    schema_editor.execute(
+        f"CREATE TABLE {qn(table)} ({', '.join(columns)}) PARTITION BY RANGE ({qn(PARTITION_KEY)})"
+    )
+    for field in model._meta.local_fields:
+        if field.db_index and not field.primary_key:
+            schema_editor.execute(
+                f"CREATE INDEX {qn(f'{table}_{field.column}_idx')} ON {qn(table)} ({qn(field.column)})"
+            )
+
+
+def create_archive_table(schema_editor, model):
+    if supports_partitioning(schema_editor.connection):
+        create_partitioned_table(schema_editor, model)
+    else:
+        schema_editor.create_model(model)
+
+
+def _month_bounds(value):
+    value = value.astimezone(dt_timezone.utc)
+    start = datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+    if value.month == 12:
+        end = datetime(value.year + 1, 1, 1, tzinfo=dt_timezone.utc)
+    else:
+        end = datetime(value.year, value.month + 1, 1, tzinfo=dt_timezone.utc)
+    return start, end
+
+
+def ensure_monthly_partitions(connection, model, datetimes):
+    """
+    ينشئ (إن لم تكن موجودة) الأقسام الشهرية التي تغطي التواريخ المعطاة.
+    لا يفعل شيئًا على قواعد البيانات التي لا تدعم التقسيم.
+    """
+    if not supports_partitioning(connection):
+        return
+    qn = connection.ops.quote_name
+    table = model._meta.db_table
+    months = {_month_bounds(value) for value in datetimes}
+    with connection.cursor() as cursor:
+        for start, end in sorted(months):
+            partition = f"{table}_p{start:%Y%m}"
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {qn(partition)} PARTITION OF {qn(table)} "
+                f"FOR VALUES FROM ('{start:%Y-%m-%d} 00:00:00+00') TO ('{end:%Y-%m-%d} 00:00:00+00')"
+            )
@@ -0,0 +1,175 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock, skipUnless
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from applications.models import Application
+from asharq_automation.models import NewsArticle, GeneratedPost
+from tasks.models import Task
+from .archivers import ArchiveConflict, run_policy
+from .compression import CODEC_ZLIB, CODEC_ZSTD, compress_text, decompress_text, resolve_codec, zstandard
+from .models import ArchivedNewsArticle, ArchivedGeneratedPost, ArchivedTask
+from .partitions import ensure_monthly_partitions
+
+
+class CompressionTests(TestCase):
+    def test_zlib_round_trip(self):
+        text = "خبر عاجل من غزة " * 50
+        blob = compress_text(text, CODEC_ZLIB)
+        self.assertLess(len(blob), len(text.encode('utf-8')))
+        self.assertEqual(decompress_text(blob, CODEC_ZLIB), text)
+
+    def test_none_round_trip(self):
+        self.assertIsNone(compress_text(None, CODEC_ZLIB))
+        self.assertIsNone(decompress_text(None, CODEC_ZLIB))
+
+    @skipUnless(zstandard, "zstandard is not installed")
+    def test_zstd_round_trip(self):
+        text = "خبر عاجل من غزة " * 50
+        self.assertEqual(resolve_codec(CODEC_ZSTD), CODEC_ZSTD)
+        blob = compress_text(text, CODEC_ZSTD)
+        self.assertLess(len(blob), len(text.encode('utf-8')))
+        self.assertEqual(decompress_text(blob, CODEC_ZSTD), text)
+
+    def test_zstd_without_library_is_an_error(self):
+        with mock.patch('retention.compression.zstandard', None):
+            with self.assertRaises(ValueError):
+                resolve_codec(CODEC_ZSTD)
+            with self.assertRaises(CommandError):
+                call_command('archive_old_records', '--model', 'tasks.Task', '--codec', 'zstd')
+        with self.assertRaises(ValueError):
+            resolve_codec('lzma')
+
+
+class RunPolicyTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('editor', 'editor@example.com', 'pw')
+        self.application = Application.objects.create(name='Style', description='Editor')
+        old = timezone.now() - timedelta(days=400)
+
+        self.old_article = NewsArticle.objects.create(user=self.user, original_text='نص قديم', topic='asharq')
+        GeneratedPost.objects.create(article=self.old_article, platform='X', content='منشور قديم')
+        self.new_article = NewsArticle.objects.create(user=self.user, original_text='نص جديد', topic='asharq')
+        GeneratedPost.objects.create(article=self.new_article, platform='X', content='منشور جديد')
+        NewsArticle.objects.filter(id=self.old_article.id).update(created_at=old)
+        GeneratedPost.objects.filter(article=self.old_article).update(created_at=old)
+
+        self.old_task = Task.objects.create(user=self.user, application=self.application, input_text='in')
+        Task.objects.filter(id=self.old_task.id).update(created_at=old)
+
+    def test_moves_old_article_with_posts_and_keeps_new_rows(self):
+        self.assertEqual(run_policy('asharq_automation.NewsArticle', days=365, chunk_size=1), 1)
+
+        self.assertEqual(list(NewsArticle.objects.values_list('id', flat=True)), [self.new_article.id])
+        self.assertEqual(GeneratedPost.objects.get().article_id, self.new_article.id)
+        archived = ArchivedNewsArticle.objects.get()
+        self.assertEqual(archived.id, self.old_article.id)
+        self.assertEqual(archived.original_text, 'نص قديم')
+        self.assertEqual(ArchivedGeneratedPost.objects.get().content, 'منشور قديم')
+
+    def test_dry_run_does_not_move_rows(self):
+        self.assertEqual(run_policy('tasks.Task', days=365, dry_run=True), 1)
+        self.assertTrue(Task.objects.filter(id=self.old_task.id).exists())
+        self.assertFalse(ArchivedTask.objects.exists())
+
+    def test_rejects_non_positive_days(self):
+        with self.assertRaises(ValueError):
+            run_policy('tasks.Task', days=-1)
+        with self.assertRaises(CommandError):
+            call_command('archive_old_records', '--model', 'tasks.Task', '--days', '0')
+        self.assertTrue(Task.objects.filter(id=self.old_task.id).exists())
+
+    def test_conflicting_archive_row_keeps_source_row(self):
+        created_at = timezone.now() - timedelta(days=500)
+        ensure_monthly_partitions(connection, ArchivedTask, [created_at])
+        ArchivedTask.objects.create(
+            id=self.old_task.id, user=self.user, application=self.application, status='PENDING',
+            created_at=created_at,
+        )
+        with self.assertRaises(ArchiveConflict):
+            run_policy('tasks.Task', days=365)
+        self.assertTrue(Task.objects.filter(id=self.old_task.id).exists())
+        self.assertEqual(ArchivedTask.objects.count(), 1)
+
+
+class ArchiveFallbackTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('editor', 'editor@example.com', 'pw')
+        self.other = User.objects.create_user('other', 'other@example.com', 'pw')
+        application = Application.objects.create(name='Style', description='Editor')
+        self.article = NewsArticle.objects.create(user=self.user, original_text='نص الخبر', topic='asharq')
+        GeneratedPost.objects.create(article=self.article, platform='X', content='منشور')
+        self.task = Task.objects.create(user=self.user, application=application, input_text='in', output_text='out')
+        old = timezone.now() - timedelta(days=400)
+        NewsArticle.objects.update(created_at=old)
+        Task.objects.update(created_at=old)
+        run_policy('asharq_automation.NewsArticle', days=365)
+        run_policy('tasks.Task', days=365)
+        self.client = APIClient()
+
+    def test_archived_article_is_readable(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(f'/api/asharq-automation/articles/{self.article.id}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['original_text'], 'نص الخبر')
+        self.assertEqual([post['content'] for post in response.data['posts']], ['منشور'])
+
+    def test_archived_task_is_readable(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.get(f'/api/tasks/{self.task.id}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['input_text'], 'in')
+        self.assertEqual(response.data['output_text'], 'out')
+
+    def test_archive_is_scoped_to_owner(self):
+        self.client.force_authenticate(self.other)
+        self.assertEqual(self.client.get(f'/api/asharq-automation/articles/{self.article.id}/').status_code, 404)
+        self.assertEqual(self.client.get(f'/api/tasks/{self.task.id}/').status_code, 404)
+        self.assertEqual(self.client.get('/api/tasks/not-a-number/').status_code, 404)
+
+
+@skipUnless(connection.vendor == 'postgresql', "Archive partitioning is PostgreSQL-only")
+class PostgresPartitionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('editor', 'editor@example.com', 'pw')
+        self.months = [datetime(2020, 1, 15, tzinfo=dt_timezone.utc), datetime(2020, 2, 20, tzinfo=dt_timezone.utc)]
+        self.articles = []
+        for index, created_at in enumerate(self.months):
+            article = NewsArticle.objects.create(user=self.user, original_text=f'نص {index}', topic='asharq')
+            GeneratedPost.objects.create(article=article, platform='X', content=f'منشور {index}')
+            NewsArticle.objects.filter(id=article.id).update(created_at=created_at)
+            GeneratedPost.objects.filter(article=article).update(created_at=created_at)
+            self.articles.append(article)
+
+    def partitions(self, model):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = %s ORDER BY child.relname",
+                [model._meta.db_table],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def test_rows_land_in_monthly_partitions(self):
+        self.assertEqual(run_policy('asharq_automation.NewsArticle', days=365, chunk_size=1), 2)
+
+        for model in (ArchivedNewsArticle, ArchivedGeneratedPost):
+            table = model._meta.db_table
+            self.assertEqual(self.partitions(model), [f'{table}_p202001', f'{table}_p202002'])
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM "{ArchivedNewsArticle._meta.db_table}_p202002"')
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        for index, article in enumerate(self.articles):
+            response = client.get(f'/api/asharq-automation/articles/{article.id}/')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data['original_text'], f'نص {index}')
+            self.assertEqual([post['content'] for post in response.data['posts']], [f'منشور {index}'])
@@ -4,17 +4,7 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from .models import StyleExample
 from .serializers import StyleExampleSerializer
-from django.conf import settings
-import google.generativeai as genai
-
-# تهيئة Gemini
-try:
-    if settings.GEMINI_API_KEY:
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-    else:
-        print("Warning: GEMINI_API_KEY not found in settings.")
-except Exception as e:
-    print(f"Warning: Gemini API key not configured. Error: {e}")
+from core.gemini import get_model
 
 class StyleExampleViewSet(viewsets.ModelViewSet):
     serializer_class = StyleExampleSerializer
@@ -55,7 +45,7 @@ class StyleExampleViewSet(viewsets.ModelViewSet):
         """
 
         try:
-            model = genai.GenerativeModel("gemini-1.5-flash")
+            model = get_model()
             response = model.generate_content(prompt)
             edited_text = response.text
             
@@ -0,0 +1,127 @@
+import codecs
+import re
+from array import array
+
+TIMING_LINE = re.compile(
+    r'^\s*((?:\d+:)?\d{1,2}:\d{2}[,.]\d{1,3})\s*-->\s*((?:\d+:)?\d{1,2}:\d{2}[,.]\d{1,3})'
+)
+# أقصى وقت مقبول (100 ساعة)، أبعد بكثير من أي بث لكنه يبقي الأوقات ضمن مصفوفات 'q'
+MAX_MILLISECONDS = 100 * 60 * 60 * 1000
+
+
+class SubtitleTrack:
+    """
+    مجموعة مقاطع ترجمة: أوقات البداية والنهاية (بالمللي ثانية) في مصفوفات أعداد صحيحة
+    متراصة، والنصوص في قائمة منفصلة بنفس الترتيب.
+    """
+    __slots__ = ('starts', 'ends', 'texts')
+
+    def __init__(self, starts=None, ends=None, texts=None):
+        self.starts = array('q', starts or [])
+        self.ends = array('q', ends or [])
+        self.texts = list(texts or [])
+
+    def __len__(self):
+        return len(self.texts)
+
+    def append(self, start, end, text):
+        self.starts.append(start)
+        self.ends.append(end)
+        self.texts.append(text)
+
+
+def time_to_milliseconds(value):
+    """
+    يحوّل '01:02:03,456' (SRT) أو '02:03.456' (VTT) إلى مللي ثانية.
+    يرفع ValueError إذا تجاوز الوقت MAX_MILLISECONDS.
+    """
+    clock, _, fraction = value.replace(',', '.').partition('.')
+    parts = clock.split(':')
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    ms = seconds * 1000 + int(fraction.ljust(3, '0')[:3])
+    if ms > MAX_MILLISECONDS:
+        raise ValueError(f"Subtitle timestamp {value} is out of range.")
+    return ms
+
+
+def milliseconds_to_time(ms, separator=','):
+    ms = max(0, int(ms))
+    seconds, millis = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{millis:03d}"
+
+
+def iter_lines(chunks, encoding='utf-8-sig'):
+    """
+    يحوّل دفعات البايتات (مثل UploadedFile.chunks()) إلى أسطر نصية دون تحميل الملف كاملًا.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    pending = ''
+    for chunk in chunks:
+        lines = (pending + decoder.decode(chunk)).split('\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line.rstrip('\r')
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending.rstrip('\r')
+
+
+def parse_subtitles(lines):
+    """
+    محلل متدفق لملفات SRT و VTT: يمر على الأسطر مرة واحدة ويبني SubtitleTrack.
+    رقم المقطع في SRT ومعرّفه في VTT اختياريان، وتُتجاهل كتل NOTE/STYLE/REGION والمقاطع الفارغة.
+    """
+    track = SubtitleTrack()
+    start = end = None
+    text_lines = []
+    skipping = False
+
+    def flush():
+        if start is not None and text_lines:
+            track.append(start, end, '\n'.join(text_lines))
+
+    for line in lines:
+        if not line.strip():
+            flush()
+            start = end = None
+            text_lines = []
+            skipping = False
+            continue
+        if skipping:
+            continue
+        if start is None:
+            match = TIMING_LINE.match(line)
+            if match:
+                start = time_to_milliseconds(match.group(1))
+                end = time_to_milliseconds(match.group(2))
+            elif line.startswith(('WEBVTT', 'NOTE', 'STYLE', 'REGION')):
+                skipping = True
+            # غير ذلك: رقم المقطع أو معرّفه، لا نحتاجه لأن الترقيم يُعاد عند الكتابة
+            continue
+        text_lines.append(line)
+    flush()
+    return track
+
+
+def iter_srt(track):
+    """
+    كتابة متدفقة بصيغة SRT: مقطع واحد في كل مرة، مع إعادة الترقيم من 1.
+    """
+    for index, (start, end, text) in enumerate(zip(track.starts, track.ends, track.texts), 1):
+        yield f"{index}\n{milliseconds_to_time(start)} --> {milliseconds_to_time(end)}\n{text}\n\n"
+
+
+def iter_vtt(track):
+    yield "WEBVTT\n\n"
+    for start, end, text in zip(track.starts, track.ends, track.texts):
+        yield f"{milliseconds_to_time(start, '.')} --> {milliseconds_to_time(end, '.')}\n{text}\n\n"
+
+
+WRITERS = {
+    'srt': (iter_srt, 'application/x-subrip'),
+    'vtt': (iter_vtt, 'text/vtt'),
+}
@@ -0,0 +1,237 @@
+import math
+import re
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from .formats import MAX_MILLISECONDS, SubtitleTrack
+
+# كل العمليات تمر على مصفوفات الأوقات مرة واحدة (أو مرتين)، فتبقى خطية في عدد المقاطع
+
+ARABIC_DIACRITICS = re.compile(r'[ً-ْٰـ]')
+WORD = re.compile(r'\w+')
+MIN_ANCHOR_CHARS = 3
+MAX_FACTOR = 1000
+
+
+def _number(value, name, cast=int, limit=MAX_MILLISECONDS):
+    """
+    يحوّل معامل العملية إلى عدد محدود، ويرفع ValueError للقيم غير الرقمية أو اللانهائية
+    أو الضخمة (مثل 1e400) بدل أن تصل إلى OverflowError داخل int() أو array.
+    """
+    try:
+        number = cast(value)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"{name} must be a number.")
+    if isinstance(number, float) and not math.isfinite(number) or abs(number) > limit:
+        raise ValueError(f"{name} must be a finite number no larger than {limit}.")
+    return number
+
+
+def _linear(track, factor, offset):
+    # t' = t * factor + offset لكل الأوقات، مع منع القيم السالبة ورفض ما يتجاوز MAX_MILLISECONDS
+    def mapped(t):
+        value = max(0, round(t * factor + offset))
+        if value > MAX_MILLISECONDS:
+            raise ValueError("Operation moves subtitles beyond the supported time range.")
+        return value
+
+    track.starts = array('q', (mapped(t) for t in track.starts))
+    track.ends = array('q', (mapped(t) for t in track.ends))
+    return track
+
+
+def shift(track, ms):
+    return _linear(track, 1, _number(ms, 'ms'))
+
+
+def scale(track, factor, anchor=0):
+    """
+    تمديد أو ضغط الأوقات حول نقطة ثابتة، لتصحيح اختلاف معدل الإطارات (مثل 25 مقابل 23.976).
+    """
+    factor = _number(factor, 'factor', float, MAX_FACTOR)
+    if factor <= 0:
+        raise ValueError("scale factor must be positive.")
+    anchor = _number(anchor, 'anchor')
+    return _linear(track, factor, anchor - anchor * factor)
+
+
+def resync(track, points):
+    """
+    مزامنة خطية من نقطتين [[وقت_حالي, وقت_صحيح], [وقت_حالي, وقت_صحيح]] بالمللي ثانية.
+    """
+    (a1, b1), (a2, b2) = [(_number(a, 'points'), _number(b, 'points')) for a, b in points]
+    if a1 == a2:
+        raise ValueError("resync points must have different source times.")
+    factor = (b2 - b1) / (a2 - a1)
+    if factor <= 0:
+        raise ValueError("resync points must keep the subtitles in order.")
+    return _linear(track, factor, b1 - a1 * factor)
+
+
+def sort_by_start(track):
+    order = sorted(range(len(track)), key=track.starts.__getitem__)
+    if order != list(range(len(track))):
+        track.starts = array('q', (track.starts[i] for i in order))
+        track.ends = array('q', (track.ends[i] for i in order))
+        track.texts = [track.texts[i] for i in order]
+    return track
+
+
+def fix_overlaps(track, min_gap=0, min_duration=1):
+    """
+    يرتب المقاطع ثم يقص نهاية كل مقطع يتداخل مع الذي يليه، مع ترك فجوة min_gap على الأقل.
+    """
+    min_gap, min_duration = _number(min_gap, 'min_gap'), _number(min_duration, 'min_duration')
+    sort_by_start(track)
+    starts, ends = track.starts, track.ends
+    for i in range(len(starts) - 1):
+        limit = starts[i + 1] - min_gap
+        if ends[i] > limit:
+            ends[i] = max(starts[i] + min_duration, limit)
+    for i in range(len(starts)):
+        if ends[i] < starts[i] + min_duration:
+            ends[i] = starts[i] + min_duration
+    return track
+
+
+def merge(track, max_duration, max_gap=0, max_chars=None):
+    """
+    يرتب المقاطع ثم يدمج المتتالية القصيرة منها ما دامت المدة الناتجة لا تتجاوز max_duration
+    والفجوة بينها لا تتجاوز max_gap (وعدد الأحرف لا يتجاوز max_chars إن حُدد).
+    """
+    max_duration, max_gap = _number(max_duration, 'max_duration'), _number(max_gap, 'max_gap')
+    if max_chars is not None:
+        max_chars = _number(max_chars, 'max_chars')
+    sort_by_start(track)
+    merged = SubtitleTrack()
+    for start, end, text in zip(track.starts, track.ends, track.texts):
+        if len(merged):
+            last = len(merged) - 1
+            combined = f"{merged.texts[last]}\n{text}"
+            if (end - merged.starts[last] <= max_duration
+                    and start - merged.ends[last] <= max_gap
+                    and (max_chars is None or len(combined) <= max_chars)):
+                merged.ends[last] = max(merged.ends[last], end)
+                merged.texts[last] = combined
+                continue
+        merged.append(start, end, text)
+    return merged
+
+
+def split(track, max_duration):
+    """
+    يقسم كل مقطع أطول من max_duration إلى أجزاء متساوية المدة، ويوزع الكلمات عليها بالتناسب.
+    """
+    max_duration = _number(max_duration, 'max_duration')
+    if max_duration <= 0:
+        raise ValueError("max_duration must be positive.")
+    result = SubtitleTrack()
+    for start, end, text in zip(track.starts, track.ends, track.texts):
+        duration = end - start
+        words = text.split()
+        parts = min(-(-duration // max_duration), len(words)) if duration > max_duration else 1
+        if parts <= 1:
+            result.append(start, end, text)
+            continue
+        step = duration / parts
+        for part in range(parts):
+            chunk = words[len(words) * part // parts:len(words) * (part + 1) // parts]
+            result.append(round(start + step * part), round(start + step * (part + 1)), ' '.join(chunk))
+    return result
+
+
+def _anchor_words(track):
+    """
+    يرجع لكل كلمة (بعد التطبيع) رقم المقطع الذي وردت فيه، بترتيب ظهورها.
+    """
+    for index, text in enumerate(track.texts):
+        for word in WORD.findall(ARABIC_DIACRITICS.sub('', text).lower()):
+            if len(word) >= MIN_ANCHOR_CHARS:
+                yield word, index
+
+
+def _longest_increasing(pairs):
+    # أطول تسلسل متزايد (patience sorting) لاستبعاد التطابقات المتقاطعة، بتعقيد n log n
+    tails, tail_index, previous = [], [], [None] * len(pairs)
+    for i, (_a, b) in enumerate(pairs):
+        position = bisect_right(tails, b)
+        if position == len(tails):
+            tails.append(b)
+            tail_index.append(i)
+        else:
+            tails[position] = b
+            tail_index[position] = i
+        previous[i] = tail_index[position - 1] if position else None
+    result = []
+    i = tail_index[-1] if tail_index else None
+    while i is not None:
+        result.append(pairs[i])
+        i = previous[i]
+    return result[::-1]
+
+
+def align(track, reference):
+    """
+    يطابق المقاطع مع نص مرجعي مزامَن مسبقًا: الكلمات التي تظهر مرة واحدة في كلا الملفين
+    تُستخدم كنقاط ارتكاز، ثم تُحسب إزاحة ومعامل تمديد بطريقة المربعات الصغرى وتُطبق على كل المقاطع.
+    """
+    words = list(_anchor_words(track))
+    reference_words = list(_anchor_words(reference))
+    counts = Counter(word for word, _ in words)
+    reference_counts = Counter(word for word, _ in reference_words)
+    reference_position = {word: index for word, index in reference_words if reference_counts[word] == 1}
+
+    pairs = [
+        (index, reference_position[word])
+        for word, index in words
+        if counts[word] == 1 and word in reference_position
+    ]
+    matched = {}
+    for index, reference_index in _longest_increasing(pairs):
+        matched.setdefault(index, reference_index)
+    if len(matched) < 2:
+        raise ValueError("Not enough matching words between the subtitles and the reference.")
+
+    xs = [track.starts[i] for i in matched]
+    ys = [reference.starts[j] for j in matched.values()]
+    n = len(xs)
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    factor = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance if variance else 1.0
+    if factor <= 0:
+        raise ValueError("Reference alignment produced an invalid time mapping.")
+    return _linear(track, factor, mean_y - mean_x * factor)
+
+
+OPERATIONS = {
+    'shift': shift,
+    'scale': scale,
+    'resync': resync,
+    'fix_overlaps': fix_overlaps,
+    'merge': merge,
+    'split': split,
+}
+
+
+def apply_operations(track, operations, reference=None):
+    """
+    ينفذ قائمة عمليات مثل [{"op": "shift", "ms": 1500}, {"op": "merge", "max_duration": 7000}].
+    يرفع ValueError عند عملية أو معاملات غير صالحة.
+    """
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise ValueError("Each operation must be an object.")
+        params = dict(operation)
+        name = params.pop('op', None)
+        if name == 'align':
+            if reference is None:
+                raise ValueError("The align operation requires a reference file.")
+            track = align(track, reference)
+            continue
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {name}")
+        try:
+            track = OPERATIONS[name](track, **params)
+        except (TypeError, OverflowError) as e:
+            raise ValueError(f"Invalid parameters for {name}: {e}")
+    return track
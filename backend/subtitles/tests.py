@@ -0,0 +1,150 @@
+import json
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+from .formats import SubtitleTrack, iter_lines, iter_srt, iter_vtt, parse_subtitles, time_to_milliseconds
+from .operations import align, apply_operations, fix_overlaps, merge, split
+
+SRT = (
+    "﻿1\r\n00:00:01,000 --> 00:00:03,500\r\nمرحبا بكم في النشرة\r\n\r\n"
+    "2\r\n00:00:03,000 --> 00:00:05,000\r\nالأخبار العاجلة من غزة\r\nسطر ثان\r\n\r\n"
+    "3\r\n01:00:05,100 --> 01:00:20,000\r\nالختام\r\n"
+)
+
+VTT = (
+    "WEBVTT - نشرة\nKind: captions\n\n"
+    "NOTE هذه ملاحظة\nتمتد على سطرين\n\n"
+    "intro\n00:01.000 --> 00:03.5 align:start\nمرحبا بكم في النشرة\n\n"
+    "00:03.000 --> 00:05.000\nالأخبار العاجلة من غزة\n"
+)
+
+
+class ParseTests(SimpleTestCase):
+    def test_time_formats(self):
+        self.assertEqual(time_to_milliseconds('01:02:03,456'), 3723456)
+        self.assertEqual(time_to_milliseconds('02:03.4'), 123400)
+        with self.assertRaises(ValueError):
+            time_to_milliseconds('99999999999999999999:00:01,000')
+
+    def test_parses_srt_with_crlf_and_bom(self):
+        track = parse_subtitles(iter_lines([SRT.encode('utf-8')]))
+        self.assertEqual(list(track.starts), [1000, 3000, 3605100])
+        self.assertEqual(list(track.ends), [3500, 5000, 3620000])
+        self.assertEqual(track.texts[1], "الأخبار العاجلة من غزة\nسطر ثان")
+
+    def test_parses_vtt_skipping_header_and_note_blocks(self):
+        track = parse_subtitles(VTT.splitlines())
+        self.assertEqual(list(track.starts), [1000, 3000])
+        self.assertEqual(list(track.ends), [3500, 5000])
+        self.assertEqual(track.texts, ["مرحبا بكم في النشرة", "الأخبار العاجلة من غزة"])
+
+    def test_iter_lines_handles_chunk_boundaries(self):
+        data = SRT.encode('utf-8')
+        expected = list(iter_lines([data]))
+        # تقسيم عند كل بايت يقطع الأحرف العربية متعددة البايتات و\r\n في المنتصف
+        self.assertEqual(list(iter_lines(data[i:i + 1] for i in range(len(data)))), expected)
+        self.assertEqual(list(iter_lines([data[:5], data[5:41], data[41:]])), expected)
+
+    def test_round_trip(self):
+        track = parse_subtitles(iter_lines([SRT.encode('utf-8')]))
+        again = parse_subtitles(''.join(iter_srt(track)).splitlines())
+        self.assertEqual((list(again.starts), list(again.ends), again.texts),
+                         (list(track.starts), list(track.ends), track.texts))
+        vtt = ''.join(iter_vtt(track))
+        self.assertTrue(vtt.startswith("WEBVTT\n\n00:00:01.000 --> 00:00:03.500\n"))
+
+
+class OperationTests(SimpleTestCase):
+    def test_fix_overlaps_sorts_and_trims(self):
+        track = SubtitleTrack([5000, 1000, 3000], [6000, 3500, 5500], ['c', 'a', 'b'])
+        fix_overlaps(track, min_gap=100)
+        self.assertEqual(track.texts, ['a', 'b', 'c'])
+        self.assertEqual(list(track.starts), [1000, 3000, 5000])
+        self.assertEqual(list(track.ends), [2900, 4900, 6000])
+
+    def test_merge_sorts_out_of_order_input(self):
+        track = SubtitleTrack([2000, 0], [3000, 1000], ['late', 'early'])
+        merged = merge(track, max_duration=5000, max_gap=1000)
+        self.assertEqual(merged.texts, ['early\nlate'])
+        self.assertEqual((list(merged.starts), list(merged.ends)), ([0], [3000]))
+
+    def test_merge_respects_max_duration(self):
+        track = SubtitleTrack([0, 1000], [1000, 7000], ['a', 'b'])
+        self.assertEqual(len(merge(track, max_duration=5000, max_gap=0)), 2)
+
+    def test_split_long_cue(self):
+        track = SubtitleTrack([0, 20000], [15000, 21000], ['one two three four five six', 'short'])
+        result = split(track, max_duration=5000)
+        self.assertEqual(result.texts, ['one two', 'three four', 'five six', 'short'])
+        self.assertEqual(list(result.starts), [0, 5000, 10000, 20000])
+        self.assertEqual(list(result.ends), [5000, 10000, 15000, 21000])
+
+    def test_align_recovers_offset_and_scale(self):
+        texts = ['مرحبا بكم في النشرة', 'الأخبار العاجلة من غزة', 'حالة الطقس غدا', 'الختام والوداع']
+        reference = SubtitleTrack([1000, 4000, 9000, 15000], [3000, 6000, 11000, 17000], texts)
+        drifted = SubtitleTrack([round(t * 1.04 + 2000) for t in reference.starts],
+                                [round(t * 1.04 + 2000) for t in reference.ends], texts)
+        aligned = align(drifted, reference)
+        for got, want in zip(aligned.starts, reference.starts):
+            self.assertAlmostEqual(got, want, delta=1)
+
+    def test_unknown_operation_and_bad_parameters(self):
+        track = SubtitleTrack([0], [1000], ['a'])
+        with self.assertRaises(ValueError):
+            apply_operations(track, [{'op': 'bogus'}])
+        with self.assertRaises(ValueError):
+            apply_operations(track, [{'op': 'shift', 'bad': 1}])
+        with self.assertRaises(ValueError):
+            apply_operations(track, [{'op': 'align'}])
+
+    def test_out_of_range_parameters(self):
+        for operation in ({'op': 'shift', 'ms': 1e19}, {'op': 'shift', 'ms': float('nan')},
+                          {'op': 'scale', 'factor': 1e300}, {'op': 'scale', 'factor': float('inf')},
+                          {'op': 'split', 'max_duration': float('inf')}, {'op': 'merge', 'max_duration': 10 ** 400},
+                          {'op': 'resync', 'points': [[0, 0], [1, 10 ** 12]]}):
+            with self.assertRaises(ValueError, msg=operation):
+                apply_operations(SubtitleTrack([0, 1000], [1000, 2000], ['a', 'b']), [operation])
+
+
+class SubtitleProcessAPITests(TestCase):
+    url = '/api/subtitles/process/'
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('editor', 'editor@example.com', 'pw'))
+
+    def test_upload_round_trip(self):
+        response = self.client.post(self.url, {
+            'file': SimpleUploadedFile('news.srt', SRT.encode('utf-8')),
+            'operations': json.dumps([{'op': 'fix_overlaps'}, {'op': 'shift', 'ms': 500}]),
+            'format': 'srt',
+        }, format='multipart')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-subrip; charset=utf-8')
+        body = b''.join(response.streaming_content).decode('utf-8')
+        self.assertTrue(body.startswith("1\n00:00:01,500 --> 00:00:03,500\nمرحبا بكم في النشرة\n\n"))
+        self.assertIn("3\n01:00:05,600 --> 01:00:20,500\nالختام", body)
+
+    def test_text_field_with_reference_to_vtt(self):
+        response = self.client.post(self.url, {
+            'file': VTT, 'reference': VTT, 'operations': [{'op': 'align'}], 'format': 'vtt',
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(b''.join(response.streaming_content).decode('utf-8').startswith("WEBVTT\n\n"))
+
+    def test_invalid_input_is_rejected(self):
+        for payload in ({'file': 5}, {}, {'file': VTT, 'format': 'ass'},
+                        {'file': VTT, 'operations': 'not json'}, {'file': VTT, 'operations': [{'op': 'bogus'}]}):
+            self.assertEqual(self.client.post(self.url, payload, format='json').status_code, 400, payload)
+
+    def test_huge_values_are_rejected(self):
+        huge_cue = "1\n99999999999999999999:00:01,000 --> 99999999999999999999:00:02,000\nنص\n"
+        self.assertEqual(self.client.post(self.url, {'file': huge_cue}, format='json').status_code, 400)
+        for operations in ('[{"op": "shift", "ms": 1e19}]', '[{"op": "scale", "factor": 1e300}]',
+                           '[{"op": "split", "max_duration": 1e400}]'):
+            response = self.client.post(self.url, {'file': VTT, 'operations': operations}, format='json')
+            self.assertEqual(response.status_code, 400, operations)
+
+    def test_requires_authentication(self):
+        self.assertEqual(APIClient().post(self.url, {'file': VTT}, format='json').status_code, 401)
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import SubtitleProcessAPI
+
+urlpatterns = [
+    path('process/', SubtitleProcessAPI.as_view()),
+]
@@ -0,0 +1,63 @@
+import json
+from django.http import StreamingHttpResponse
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework import status
+from .formats import WRITERS, iter_lines, parse_subtitles
+from .operations import apply_operations
+
+
+def _read_track(request, name):
+    """
+    يقرأ ملف ترجمة مرفوعًا (أو نصًا في حقل بنفس الاسم) بشكل متدفق.
+    """
+    upload = request.FILES.get(name)
+    if upload is not None:
+        return parse_subtitles(iter_lines(upload.chunks()))
+    content = request.data.get(name)
+    if content is None or content == '':
+        return None
+    if not isinstance(content, str):
+        raise ValueError(f"{name} must be an uploaded file or subtitle text.")
+    return parse_subtitles(content.splitlines())
+
+
+class SubtitleProcessAPI(APIView):
+    """
+    يستقبل ملف SRT/VTT وقائمة عمليات (إزاحة، تمديد، إصلاح التداخل، دمج، تقسيم، مطابقة مع مرجع)
+    ويرجع الملف الناتج بشكل متدفق.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        output_format = request.data.get('format', 'srt')
+        if output_format not in WRITERS:
+            return Response({"error": f"Unsupported format: {output_format}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        operations = request.data.get('operations', [])
+        if isinstance(operations, str):
+            try:
+                operations = json.loads(operations)
+            except ValueError:
+                return Response({"error": "operations must be valid JSON."}, status=status.HTTP_400_BAD_REQUEST)
+        if not isinstance(operations, list):
+            return Response({"error": "operations must be a list."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            track = _read_track(request, 'file')
+            reference = _read_track(request, 'reference')
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if track is None:
+            return Response({"error": "A subtitle file is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            track = apply_operations(track, operations, reference=reference)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        writer, content_type = WRITERS[output_format]
+        response = StreamingHttpResponse(writer(track), content_type=f"{content_type}; charset=utf-8")
+        response['Content-Disposition'] = f'attachment; filename="subtitles.{output_format}"'
+        return response
@@ -2,8 +2,18 @@ from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 from .models import Task
 from .serializers import TaskSerializer
+from retention.models import ArchivedTask
+from django.http import Http404
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
 class TaskViewSet(viewsets.ModelViewSet):
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
     def get_queryset(self): return Task.objects.filter(user=self.request.user)
-    def perform_create(self, serializer): serializer.save(user=self.request.user)
\ No newline at end of file
+    def perform_create(self, serializer): serializer.save(user=self.request.user)
+    def retrieve(self, request, *args, **kwargs):
+        # المهام المؤرشفة تبقى قابلة للقراءة من نفس الرابط
+        try: return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            archived = get_object_or_404(ArchivedTask, pk=kwargs['pk'], user=request.user)
+            return Response(self.get_serializer(archived).data)
\ No newline at end of file